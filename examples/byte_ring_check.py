@@ -0,0 +1,59 @@
+# Stress check of ByteRing used by process Nyanger to pass messages to log process.
+# Several producer processes put records of random size, many bigger than half of the small ring,
+# so records wrap around the end of the buffer and are split into pieces.
+# Consumer checks that every record arrives whole and in order, with fork and spawn start methods.
+import multiprocessing as mp
+import random
+import struct
+import sys
+from nyanger.process.byte_ring import ByteRing
+
+PRODUCERS = 4
+RECORDS = 3000
+MAX_RECORD_SIZE = 3000
+RING_SIZE = 4096
+_ID = struct.Struct("<II")
+
+
+def make_record(producer: int, number: int) -> bytes:
+    size = random.Random(producer * RECORDS + number).randint(0, MAX_RECORD_SIZE)
+    body = bytes((producer + number + i) % 251 for i in range(size))
+    return _ID.pack(producer, number) + body
+
+
+def produce(ring: ByteRing, producer: int):
+    for number in range(RECORDS):
+        if not ring.put(make_record(producer, number), tag=producer, timeout=10.0):
+            raise RuntimeError(f"Producer {producer} failed to put record {number}")
+
+
+def check(start_method: str):
+    # ByteRing creates its locks in default context, so it is switched for each check
+    mp.set_start_method(start_method, force=True)
+    ring = ByteRing(RING_SIZE)
+    ring.set_reading(True)
+    producers = [mp.Process(target=produce, args=(ring, producer)) for producer in range(PRODUCERS)]
+    for process in producers:
+        process.start()
+
+    expected = [0] * PRODUCERS
+    received = 0
+    while received < PRODUCERS * RECORDS:
+        for tag, data in ring.get_many():
+            producer, number = _ID.unpack_from(data)
+            assert tag == producer, f"tag {tag} of record from producer {producer}"
+            assert number == expected[producer], f"record {number} of producer {producer}, expected {expected[producer]}"
+            assert data == make_record(producer, number), f"record {number} of producer {producer} is corrupted"
+            expected[producer] += 1
+            received += 1
+
+    ring.set_reading(False)
+    for process in producers:
+        process.join()
+        assert process.exitcode == 0, f"producer exited with code {process.exitcode}"
+    print(f"{start_method}: {received} records ok")
+
+
+if __name__ == '__main__':
+    for method in sys.argv[1:] or ["fork", "spawn"]:
+        check(method)
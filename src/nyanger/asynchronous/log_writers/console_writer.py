@@ -16,7 +16,9 @@
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from typing import Optional
+import os
 import sys
+import time
 import asyncio
 from nyanger.asynchronous.nyan import LogLevel, LogMessage, LogWriter
 
@@ -66,17 +68,45 @@ class Colors:
 # note: if nothing ever drains the writer explicitly, no flushing ever takes place!
 class _Win32StdoutWriter:
     def __init__(self, loop: asyncio.AbstractEventLoop):
-        self.buffer = []
+        # single preallocated staging buffer, written data is copied into it
+        self.buffer = bytearray(1 << 16)
+        self.offset = 0
         self.stdout = sys.stdout.buffer
         self.loop = loop
 
-    def write(self, data):
-        self.buffer.append(data)
+    def write(self, data: bytes):
+        # slice assignment grows the buffer when data does not fit
+        self.buffer[self.offset:self.offset + len(data)] = data
+        self.offset += len(data)
 
     async def drain(self):
-        data, self.buffer = self.buffer, []
-        # a single call to sys.stdout.writelines() is thread-safe
-        return await self.loop.run_in_executor(None, sys.stdout.writelines, data)
+        if self.offset == 0:
+            return
+        data = bytes(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+        return await self.loop.run_in_executor(None, self._write_stdout, data)
+
+    def _write_stdout(self, data: bytes):
+        self.stdout.write(data)
+        self.stdout.flush()
+
+
+class _StdoutProtocol(asyncio.streams.FlowControlMixin):
+    """Write pipe protocol with close waiter, so StreamWriter.wait_closed can wait for stdout pipe to close."""
+
+    def __init__(self):
+        super().__init__()
+        self._closed = asyncio.get_running_loop().create_future()
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def _get_close_waiter(self, stream: asyncio.StreamWriter) -> asyncio.Future:
+        # Private asyncio hook, StreamWriter.wait_closed awaits future returned by it,
+        # FlowControlMixin does not implement it and StreamReaderProtocol needs a reader
+        return self._closed
 
 
 async def _get_async_stdout(loop: asyncio.AbstractEventLoop) -> asyncio.StreamWriter | _Win32StdoutWriter:
@@ -90,7 +120,9 @@ async def _get_async_stdout(loop: asyncio.AbstractEventLoop) -> asyncio.StreamWr
         return _Win32StdoutWriter(loop)
 
     loop = asyncio.get_event_loop()
-    w_transport, w_protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    # Transport gets its own duplicate of stdout, so closing transport (uvloop does it) does not close sys.stdout
+    stdout = os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=0)
+    w_transport, w_protocol = await loop.connect_write_pipe(_StdoutProtocol, stdout)
     writer = asyncio.StreamWriter(w_transport, w_protocol, None, loop)
     return writer
 
@@ -108,6 +140,7 @@ class ConsoleWriter(LogWriter):
         :param color_map: dictionary mapping console color codes to logging levels.
         """
         self._loging_level = loging_level
+        self._level_int = loging_level.value
 
         if color_map is None:
             self._color_map = {
@@ -121,19 +154,63 @@ class ConsoleWriter(LogWriter):
 
         self._writer: Optional[asyncio.StreamWriter | _Win32StdoutWriter] = None
 
+        self._color_tuple = tuple(self._color_map.get(severity, "").encode() for severity in LogLevel)
+        """Color codes encoded to bytes, indexed by severity value."""
+        self._severity_tuple = tuple(f"%06d {severity.name}: ".encode() for severity in LogLevel)
+        """Microseconds format followed by severity name, indexed by severity value."""
+        self._suffix = b"\n" + Colors.RESET.encode()
+        self._last_seconds_prefixes = (None, ())
+        """Second of the last written message and line prefixes (color and time) of each severity for that second."""
+
     async def start(self, loop: asyncio.AbstractEventLoop):
-        self._writer = _get_async_stdout(loop)
+        self._writer = await _get_async_stdout(loop)
+
+    def get_loging_level(self) -> LogLevel:
+        """Logging level of the writer."""
+        return self._loging_level
+
+    def _format(self, msg: LogMessage) -> bytes:
+        """
+        Formats msg to colored line.
+        :param msg: message to be logged.
+        :return: encoded line, empty if message is filtered out.
+        """
+        severity = msg.severity
+        if severity <= self._level_int:
+            seconds, nanoseconds = divmod(msg.time, 1_000_000_000)
+            last_seconds, prefixes = self._last_seconds_prefixes
+            if seconds != last_seconds:
+                seconds_iso = time.strftime("%Y-%m-%dT%H:%M:%S.", time.localtime(seconds)).encode()
+                prefixes = tuple(color + seconds_iso for color in self._color_tuple)
+                self._last_seconds_prefixes = (seconds, prefixes)
+            return b"".join((prefixes[severity], self._severity_tuple[severity] % (nanoseconds // 1000),
+                             msg.text_bytes, self._suffix))
+        return b""
 
     async def write(self, msg: LogMessage):
         """
         Formats and writes msg to (sys.stdout).
+        Does not wait for data to be flushed, logging loop calls drain for that.
         :param msg: message to be logged.
         """
-        if msg.severity.value <= self._loging_level.value:
-            log_text = f"{self._color_map[msg.severity]}{msg.time.isoformat()} {msg.severity.name}: {msg.text}\n{Colors.RESET}"
-            self._writer.write(log_text)
-            await self._writer.drain()
+        self._writer.write(self._format(msg))
+
+    async def write_many(self, msgs: list[LogMessage]):
+        """
+        Formats and writes msgs to (sys.stdout) with single write.
+        Does not wait for data to be flushed, logging loop calls drain for that.
+        :param msgs: messages to be logged.
+        """
+        self._writer.write(b"".join([self._format(msg) for msg in msgs]))
+
+    async def drain(self):
+        """Wait for written messages to be flushed."""
+        await self._writer.drain()
 
     async def stop(self):
-        """Drain writer"""
+        """Drain writer and close it, closing the duplicate of stdout it owns."""
         await self._writer.drain()
+        if not isinstance(self._writer, _Win32StdoutWriter):
+            self._writer.close()
+            await self._writer.wait_closed()
+        self._writer = None
@@ -18,13 +18,14 @@
 from typing import Optional
 import asyncio
 from abc import ABC, abstractmethod
-from datetime import datetime
-from enum import Enum
+from time import time_ns
+from enum import IntEnum
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """
     Enumerates logging levels.
+    Levels are ints, so they can be compared and used as indexes without accessing enum value.
     """
     OTHER = 0
     INFO = 1
@@ -36,18 +37,21 @@ class LogLevel(Enum):
 class LogMessage:
     """
     Represents message to be logged.
-    Contains time severity and text fields.
+    Contains time severity and text fields, and text encoded to UTF-8 once for all log writers.
     """
-    def __init__(self, time: datetime, severity: LogLevel, text: str):
+    __slots__ = ("time", "severity", "text", "text_bytes")
+
+    def __init__(self, time: int, severity: LogLevel, text: str):
         """
         Initialize LogMessage instance.
-        :param time: message time.
+        :param time: message time in nanoseconds since the epoch, as returned by time.time_ns().
         :param severity: severity level of the message.
         :param text: message content.
         """
         self.time = time
         self.severity = severity
         self.text = text
+        self.text_bytes = text.encode("utf-8", "backslashreplace")
 
 
 class LogWriter(ABC):
@@ -73,6 +77,30 @@ class LogWriter(ABC):
         :return:
         """
 
+    def get_loging_level(self) -> Optional[LogLevel]:
+        """
+        Messages with severity less than returned level will not be written by this writer.
+        Nyanger uses it to filter out messages that no writer will write.
+        :return: logging level of the writer, or None if writer writes messages of any severity.
+        """
+        return None
+
+    async def write_many(self, msgs: list[LogMessage]):
+        """
+        This method called by logging loop with all messages it has taken from the queue at once.
+        Override it to write them in one go.
+        :param msgs: messages to be logged.
+        """
+        for msg in msgs:
+            await self.write(msg)
+
+    async def drain(self):
+        """
+        This method called by logging loop after it has written all currently queued messages.
+        Writer should wait here for written data to be flushed.
+        """
+        pass
+
     @abstractmethod
     async def stop(self):
         """
@@ -89,10 +117,11 @@ class Nyanger:
     def __init__(self, name: str, loging_level: LogLevel, log_writers: list[LogWriter]):
         self.name = name
         """Logger name."""
+        self._log_writers = tuple(log_writers)
+        """Log writers, frozen to a tuple as they never change after initialization."""
         self.loging_level = loging_level
-        """Logging level, messages with severity less than this field value will be filtered out."""
-        self._log_writers = log_writers.copy()
-        """List of log writers."""
+        self._write_many = self._log_writers[0].write_many if len(self._log_writers) == 1 else self._write_many_all
+        """Writes messages to log writers, bound directly to the write_many method when there is only one writer."""
         self._log_queue: Optional[asyncio.Queue[LogMessage | int]] = None
         """Queue of log messages used to pass them to logging loop."""
         self._logging_loop_task: Optional[asyncio.Task] = None
@@ -100,21 +129,57 @@ class Nyanger:
         self._STOP_MESSAGE = 0
         """Constant representing message that need to be putted in self._log_queue in order to break logging loop."""
 
+    @property
+    def loging_level(self) -> LogLevel:
+        """Logging level, messages with severity less than this field value will be filtered out."""
+        return self._loging_level
+
+    @loging_level.setter
+    def loging_level(self, loging_level: LogLevel):
+        self._loging_level = loging_level
+        # Messages that no log writer will write are filtered out right away,
+        # plain int is cheaper to compare than enum value on every log call
+        effective_level = loging_level.value
+        writer_levels = [log_writer.get_loging_level() for log_writer in self._log_writers]
+        if writer_levels and None not in writer_levels:
+            effective_level = min(effective_level, max(level.value for level in writer_levels))
+        self._effective_level = effective_level
+
+    async def _write_many_all(self, messages: list[LogMessage]):
+        for log_writer in self._log_writers:
+            await log_writer.write_many(messages)
+
     async def _logging_loop(self, loop: asyncio.AbstractEventLoop):
         for log_writer in self._log_writers:
             await log_writer.start(loop)
 
-        while True:
+        # Bound once to locals, they are cheaper to look up than attributes on every message
+        queue_get = self._log_queue.get
+        queue_get_nowait = self._log_queue.get_nowait
+        queue_empty = self._log_queue.empty
+        task_done = self._log_queue.task_done
+        write_many = self._write_many
+        drains = tuple(log_writer.drain for log_writer in self._log_writers)
+        stop_message = self._STOP_MESSAGE
+
+        stop = False
+        while not stop:
             try:
-                message = await self._log_queue.get()
-                self._log_queue.task_done()
-                if message == self._STOP_MESSAGE:
-                    break
+                # Take all queued messages, write them at once and drain writers once per burst
+                messages = [await queue_get()]
+                while not queue_empty():
+                    messages.append(queue_get_nowait())
+                for _ in messages:
+                    task_done()
 
-                for log_writer in self._log_writers:
-                    await log_writer.write(message)
+                if stop_message in messages:
+                    stop = True
+                    messages = messages[:messages.index(stop_message)]
 
-                self._log_queue.task_done()
+                if messages:
+                    await write_many(messages)
+                    for drain in drains:
+                        await drain()
 
             except asyncio.CancelledError:
                 break
@@ -147,7 +212,7 @@ class Nyanger:
         :param supress_timeout_error: Pum
         :return:
         """
-        await self._log_queue.put(self._STOP_MESSAGE)
+        self._log_queue.put_nowait(self._STOP_MESSAGE)
         # Wait for at most timeout seconds
         try:
             await asyncio.wait_for(self._logging_loop_task, timeout=timeout)
@@ -162,10 +227,10 @@ class Nyanger:
         :param severity: severity of the message.
         :return:
         """
-        # Filter messages with severity lower than self.loging_level
-        if severity.value <= self.loging_level.value:
-            # Create and put LogMessage to log queue
-            await self._log_queue.put(LogMessage(datetime.now(), severity, message))
+        # Filter messages with severity lower than self.loging_level or than levels of all log writers
+        if severity <= self._effective_level:
+            # Create and put LogMessage to log queue, queue is unbounded so put_nowait never fails
+            self._log_queue.put_nowait(LogMessage(time_ns(), severity, message))
 
     async def other(self, message: str):
         """
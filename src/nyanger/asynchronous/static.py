@@ -15,9 +15,16 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from typing import Any, Coroutine
+import asyncio
 from nyanger.asynchronous.log_writers.console_writer import ConsoleWriter
 from nyanger.asynchronous.nyan import *
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 _loggers: dict[str, Nyanger] = {}
 """Dictionary containing loggers"""
 
@@ -42,3 +49,18 @@ def get_logger(name: str, loging_level: LogLevel = LogLevel.DEBUG,
     new_logger = Nyanger(name, loging_level=loging_level, log_writers=log_writers)
     _loggers[name] = new_logger
     return new_logger
+
+
+def run(main: Coroutine[Any, Any, Any], use_uvloop: bool = True) -> Any:
+    """
+    Runs main coroutine in a new event loop, like asyncio.run does.
+    If uvloop is installed (pip install nyanger[uvloop]) it is used as event loop,
+    which makes writes to stdout and other pipes and sockets cheaper.
+    Event loop can not be replaced once it is running, so use this function instead of asyncio.run.
+    :param main: coroutine to run.
+    :param use_uvloop: use uvloop if it is installed.
+    :return: result of main coroutine.
+    """
+    if use_uvloop and uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,193 @@
+#     Nyanger is a simple logger designed to be simple to use and simple to modify.
+#
+#     Copyright (C) 2024  Kirill Harmatulla Shakirov  kirill.shakirov@protonmail.com
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+from multiprocessing import Lock, Semaphore, RawArray, RawValue
+from typing import Optional
+import ctypes
+import struct
+import time
+
+
+_WHOLE = 0
+"""Fragment flag of record put to the ring in one piece."""
+_FIRST = 1
+"""Fragment flag of first piece of record too big to be put to the ring in one piece."""
+_MIDDLE = 2
+"""Fragment flag of middle piece of split record."""
+_LAST = 3
+"""Fragment flag of last piece of split record."""
+
+
+class ByteRing:
+    """
+    Ring buffer of byte records placed in shared memory.
+    Any number of processes can put records into it, but only one process can get them.
+    Records are copied to shared memory directly, without pickling and without background feeder thread.
+    Records bigger than half of the ring are split into pieces that consumer joins back,
+    so records of any size can be put, but such record is put only as fast as consumer frees space for it.
+    """
+    _HEADER = struct.Struct("<IBB")
+    """Record header: length of record data, record tag and fragment flag."""
+
+    def __init__(self, size: int = 1 << 20):
+        """
+        Initialize ByteRing instance.
+        :param size: size of shared memory in bytes.
+        """
+        self._size = size
+        self._fragment_size = size // 2
+        """Size of pieces that records bigger than half of the ring are split into."""
+        self._buffer = RawArray(ctypes.c_char, size)
+        """Shared memory holding records."""
+        self._view = memoryview(self._buffer).cast("B")
+        self._head = RawValue(ctypes.c_uint64, 0)
+        """Total number of bytes ever put to the ring."""
+        self._tail = RawValue(ctypes.c_uint64, 0)
+        """Total number of bytes ever got from the ring."""
+        self._put_lock = Lock()
+        """Serializes producers."""
+        self._records = Semaphore(0)
+        """Number of records available for reading, consumer blocks on it."""
+        self._reading = RawValue(ctypes.c_bool, False)
+        """Whether consumer is reading, producers wait for free space only if it is."""
+        self._fragments: Optional[list[bytes]] = None
+        """Pieces of split record taken so far, used only by consumer."""
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_view"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._view = memoryview(self._buffer).cast("B")
+
+    def set_reading(self, reading: bool):
+        """
+        Marks if consumer reads records from the ring.
+        While no one reads, records put to full ring are dropped instead of waiting for free space.
+        :param reading: True if consumer reads records.
+        """
+        self._reading.value = reading
+
+    def put(self, data: bytes, tag: int = 0, timeout: float = 1.0) -> bool:
+        """
+        Copies record to the ring, waits for free space if ring is full.
+        If consumer frees no space for timeout seconds it is considered gone, record is dropped
+        and ring is marked as not read, so other producers do not wait for it either.
+        :param data: record data.
+        :param tag: small int (0-255) passed along with the record.
+        :param timeout: number of seconds to wait for consumer to free some space.
+        :return: True if record was put, False if ring is full and no one reads it.
+        """
+        with self._put_lock:
+            if self._HEADER.size + len(data) <= self._size:
+                return self._put_record(data, tag, _WHOLE, timeout)
+
+            # Hold the lock for all pieces, so pieces of different records are not mixed
+            data = memoryview(data)
+            for start in range(0, len(data), self._fragment_size):
+                end = start + self._fragment_size
+                fragment = _FIRST if start == 0 else _LAST if end >= len(data) else _MIDDLE
+                if not self._put_record(data[start:end], tag, fragment, timeout):
+                    return False
+            return True
+
+    def _put_record(self, data: bytes, tag: int, fragment: int, timeout: float) -> bool:
+        header_size = self._HEADER.size
+        record_size = header_size + len(data)
+        head = self._head.value
+        tail = self._tail.value
+        deadline = time.monotonic() + timeout
+        while head + record_size - tail > self._size:
+            if not self._reading.value:
+                return False
+            time.sleep(0.001)
+            if self._tail.value != tail:
+                tail = self._tail.value
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() > deadline:
+                self._reading.value = False
+                return False
+
+        self._copy_in(head, self._HEADER.pack(len(data), tag, fragment))
+        self._copy_in(head + header_size, data)
+        self._head.value = head + record_size
+        self._records.release()
+        return True
+
+    def get(self) -> tuple[int, bytes]:
+        """
+        Takes next record from the ring, waits for it if ring is empty.
+        :return: tag and data of the record.
+        """
+        return self.get_many(1)[0]
+
+    def get_many(self, max_records: int = 1024) -> list[tuple[int, bytes]]:
+        """
+        Takes all records currently available in the ring, waits for at least one if ring is empty.
+        :param max_records: maximum number of records to take.
+        :return: list of tags and data of the records.
+        """
+        records = []
+        while not records:
+            self._records.acquire()
+            # Consumer is reading, even if producers considered it gone while it was busy
+            self._reading.value = True
+            self._take(records)
+            while len(records) < max_records and self._records.acquire(False):
+                self._take(records)
+        return records
+
+    def _take(self, records: list[tuple[int, bytes]]):
+        header_size = self._HEADER.size
+        tail = self._tail.value
+        length, tag, fragment = self._HEADER.unpack(self._copy_out(tail, header_size))
+        data = self._copy_out(tail + header_size, length)
+        self._tail.value = tail + header_size + length
+
+        if fragment == _WHOLE:
+            # Pieces of record left unfinished by producer that gave up are dropped
+            self._fragments = None
+            records.append((tag, data))
+        elif fragment == _FIRST:
+            self._fragments = [data]
+        elif self._fragments is not None:
+            self._fragments.append(data)
+            if fragment == _LAST:
+                records.append((tag, b"".join(self._fragments)))
+                self._fragments = None
+
+    def _copy_in(self, position: int, data: bytes):
+        start = position % self._size
+        end = start + len(data)
+        if end <= self._size:
+            self._view[start:end] = data
+        else:
+            # Record wraps around the end of the buffer
+            split = self._size - start
+            data = memoryview(data)
+            self._view[start:] = data[:split]
+            self._view[:end - self._size] = data[split:]
+
+    def _copy_out(self, position: int, length: int) -> bytes:
+        start = position % self._size
+        end = start + length
+        if end <= self._size:
+            return self._view[start:end].tobytes()
+        return self._view[start:].tobytes() + self._view[:end - self._size].tobytes()
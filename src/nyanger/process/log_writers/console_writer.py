@@ -15,8 +15,10 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import Optional, Sequence
+import os
 import sys
+import time
 from nyanger.process.nyan import LogLevel, LogMessage, LogWriter
 
 
@@ -60,6 +62,13 @@ class Colors:
         LIGHT_GRAY = '\033[47m'
 
 
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+"""Maximum number of buffers passed to single os.writev call."""
+
+
 class ConsoleWriter(LogWriter):
     """
     Simple implementation of LogWriter.
@@ -72,6 +81,7 @@ class ConsoleWriter(LogWriter):
         :param color_map: dictionary mapping console color codes to logging levels.
         """
         self._loging_level = loging_level
+        self._level_int = loging_level.value
 
         if color_map is None:
             self._color_map = {
@@ -83,20 +93,102 @@ class ConsoleWriter(LogWriter):
         else:
             self._color_map = color_map
 
+        self._color_tuple = tuple(self._color_map.get(severity, "").encode() for severity in LogLevel)
+        """Color codes encoded to bytes, indexed by severity value."""
+        self._severity_tuple = tuple(f"%06d {severity.name}: ".encode() for severity in LogLevel)
+        """Microseconds format followed by severity name, indexed by severity value."""
+        self._suffix = b"\n" + Colors.RESET.encode()
+        self._last_seconds_prefixes = (None, ())
+        """Second of the last written message and line prefixes (color and time) of each severity for that second."""
+        self._fd: Optional[int] = None
+        """Stdout file descriptor, obtained inside log process."""
+        self._stream = None
+        """Stdout text stream, written to if it has no file descriptor."""
+
     def start(self):
-        """Doing nothing"""
-        pass
+        """
+        Obtain stdout file descriptor.
+        If sys.stdout has no file descriptor, like io.StringIO or IDE console, messages are written to it as text,
+        and if it is None, like under pythonw, messages are discarded.
+        """
+        self._stream = sys.stdout
+        self._fd = None
+        if self._stream is not None:
+            self._stream.flush()
+            try:
+                self._fd = self._stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                # io.UnsupportedOperation is an OSError and ValueError
+                pass
+
+    def get_loging_level(self) -> LogLevel:
+        """Logging level of the writer."""
+        return self._loging_level
 
-    def write(self, msg: LogMessage):
+    def format(self, msg: LogMessage) -> Optional[bytes]:
         """
-        Formats and writes msg to (sys.stdout).
+        Formats msg to colored line, called in the process that logs the message.
         :param msg: message to be logged.
+        :return: encoded line or None if message is filtered out.
+        """
+        severity = msg.severity
+        if severity <= self._level_int:
+            seconds, nanoseconds = divmod(msg.time, 1_000_000_000)
+            last_seconds, prefixes = self._last_seconds_prefixes
+            if seconds != last_seconds:
+                seconds_iso = time.strftime("%Y-%m-%dT%H:%M:%S.", time.localtime(seconds)).encode()
+                prefixes = tuple(color + seconds_iso for color in self._color_tuple)
+                self._last_seconds_prefixes = (seconds, prefixes)
+            return b"".join((prefixes[severity], self._severity_tuple[severity] % (nanoseconds // 1000),
+                             msg.text_bytes, self._suffix))
+        return None
+
+    def write(self, msg: bytes):
+        """
+        Writes formatted msg to (sys.stdout).
+        :param msg: message formatted by format method.
         :return:
         """
-        if msg.severity.value <= self._loging_level.value:
-            log_text = f"{self._color_map[msg.severity]}{msg.time.isoformat()} {msg.severity.name}: {msg.text}\n{Colors.RESET}"
-            sys.stdout.write(log_text)
+        if self._fd is not None:
+            _write_parts(self._fd, (msg,))
+        else:
+            self._write_text((msg,))
+
+    def write_many(self, msgs: list[bytes]):
+        """
+        Writes formatted msgs to (sys.stdout) with as few vectored writes as possible.
+        :param msgs: messages formatted by format method.
+        """
+        if self._fd is None:
+            self._write_text(msgs)
+            return
+        for i in range(0, len(msgs), _IOV_MAX):
+            _write_parts(self._fd, msgs[i:i + _IOV_MAX])
+
+    def _write_text(self, msgs: Sequence[bytes]):
+        if self._stream is not None:
+            self._stream.write(b"".join(msgs).decode("utf-8", "backslashreplace"))
+            self._stream.flush()
 
     def stop(self):
         """Doing nothing"""
         pass
+
+
+def _write_parts(fd: int, parts: Sequence[bytes]):
+    """
+    Write all parts to file descriptor without joining them first if possible.
+    :param fd: file descriptor.
+    :param parts: byte strings to write.
+    """
+    if hasattr(os, "writev"):
+        written = os.writev(fd, parts)
+        if written == sum(map(len, parts)):
+            return
+        data = memoryview(b"".join(parts))[written:]
+    else:
+        data = memoryview(b"".join(parts))
+
+    # Handle partial writes
+    while data:
+        data = data[os.write(fd, data):]
@@ -15,16 +15,19 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from multiprocessing import Process, Queue as ProcessQueue
+from multiprocessing import Process
 from typing import Optional
-from datetime import datetime
+from time import time_ns
 from abc import ABC, abstractmethod
-from enum import Enum
+from enum import IntEnum
+import pickle
+from nyanger.process.byte_ring import ByteRing
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """
     Enumerates logging levels.
+    Levels are ints, so they can be compared and used as indexes without accessing enum value.
     """
     OTHER = 0
     INFO = 1
@@ -36,18 +39,21 @@ class LogLevel(Enum):
 class LogMessage:
     """
     Represents message to be logged.
-    Contains time severity and text fields.
+    Contains time severity and text fields, and text encoded to UTF-8 once for all log writers.
     """
-    def __init__(self, time: datetime, severity: LogLevel, text: str):
+    __slots__ = ("time", "severity", "text", "text_bytes")
+
+    def __init__(self, time: int, severity: LogLevel, text: str):
         """
         Initialize LogMessage instance.
-        :param time: message time.
+        :param time: message time in nanoseconds since the epoch, as returned by time.time_ns().
         :param severity: severity level of the message.
         :param text: message content.
         """
         self.time = time
         self.severity = severity
         self.text = text
+        self.text_bytes = text.encode("utf-8", "backslashreplace")
 
 
 class LogWriter(ABC):
@@ -57,6 +63,11 @@ class LogWriter(ABC):
     Only write method must be implemented, start and stop methods one should implement as needed.
     Start method will be called by Nyanger inside log precess on its start.
     And stop method will be called inside log process after exiting logging loop.
+    Format method is called in the process that logs the message, its result is passed to write method
+    inside log process, so it must be picklable. Override it to do formatting work before message leaves
+    the process, and to pass plain data like bytes instead of LogMessage objects between processes.
+    The same log writers are used by threaded Nyanger, it calls all methods, format included,
+    in its logging thread and passes format results to write method as is, without pickling.
     """
     @abstractmethod
     def start(self):
@@ -65,14 +76,39 @@ class LogWriter(ABC):
         """
         pass
 
+    def format(self, msg: LogMessage) -> object:
+        """
+        This method called in the process that logs the message, or in logging thread of threaded Nyanger.
+        :param msg: message to be logged.
+        :return: data that will be passed to write method, or None if message should not be written.
+        """
+        return msg
+
     @abstractmethod
-    def write(self, msg: LogMessage):
+    def write(self, msg):
         """
         This method called by logging loop when message need to be logged.
-        :param msg: message to be logged.
+        :param msg: message to be logged, as returned by format method.
         :return:
         """
 
+    def write_many(self, msgs: list):
+        """
+        This method called by logging loop with all messages it has taken from the queue at once.
+        Override it to write them in one go.
+        :param msgs: messages to be logged, as returned by format method.
+        """
+        for msg in msgs:
+            self.write(msg)
+
+    def get_loging_level(self) -> Optional[LogLevel]:
+        """
+        Messages with severity less than returned level will not be written by this writer.
+        Nyanger uses it to filter out messages that no writer will write.
+        :return: logging level of the writer, or None if writer writes messages of any severity.
+        """
+        return None
+
     @abstractmethod
     def stop(self):
         """
@@ -89,32 +125,85 @@ class Nyanger:
     def __init__(self, name: str, loging_level: LogLevel, log_writers: list[LogWriter]):
         self.name = name
         """Logger name."""
+        self._log_writers = tuple(log_writers)
+        """Log writers, frozen to a tuple as they never change after initialization."""
         self.loging_level = loging_level
-        """Logging level, messages with severity less than this field value will be filtered out"""
-        self._log_writers = log_writers.copy()
-        """List of log writers."""
-        self._log_queue: ProcessQueue[LogMessage | int] = ProcessQueue()
-        """Queue of log messages used to pass them to log process."""
+        if len(self._log_writers) == 1:
+            self._format = self._log_writers[0].format
+            self._write_many = self._log_writers[0].write_many
+        else:
+            self._format = self._format_all
+            self._write_many = self._write_many_all
+        """Format and write messages, bound directly to log writer methods when there is only one writer."""
+        self._log_queue = ByteRing()
+        """Shared memory ring of formatted log messages used to pass them to log process."""
         self._nyan_process: Optional[Process] = None
         """Stores log process."""
-        self._STOP_MESSAGE = 0
-        """Constant representing message that need to be putted in self._log_queue in order to break logging loop."""
+        self._BYTES_MESSAGE = 0
+        """Tag of messages formatted by log writers to bytes, passed to log process as is."""
+        self._PICKLED_MESSAGE = 1
+        """Tag of messages formatted by log writers to other objects, passed to log process pickled."""
+        self._STOP_MESSAGE = 2
+        """Tag of message that need to be putted in self._log_queue in order to break logging loop."""
+
+    @property
+    def loging_level(self) -> LogLevel:
+        """Logging level, messages with severity less than this field value will be filtered out."""
+        return self._loging_level
+
+    @loging_level.setter
+    def loging_level(self, loging_level: LogLevel):
+        self._loging_level = loging_level
+        # Messages that no log writer will write are filtered out right away,
+        # plain int is cheaper to compare than enum value on every log call
+        effective_level = loging_level.value
+        writer_levels = [log_writer.get_loging_level() for log_writer in self._log_writers]
+        if writer_levels and None not in writer_levels:
+            effective_level = min(effective_level, max(level.value for level in writer_levels))
+        self._effective_level = effective_level
+
+    def _format_all(self, message: LogMessage) -> tuple:
+        return tuple(log_writer.format(message) for log_writer in self._log_writers)
+
+    def _write_many_all(self, messages: list[tuple]):
+        for i, log_writer in enumerate(self._log_writers):
+            log_writer_messages = [message[i] for message in messages if message[i] is not None]
+            if log_writer_messages:
+                log_writer.write_many(log_writer_messages)
 
     def _logging_loop(self):
-        for log_writer in self._log_writers:
-            log_writer.start()
+        # Bound once to locals, they are cheaper to look up than attributes on every message
+        get_many = self._log_queue.get_many
+        write_many = self._write_many
+        stop_message = self._STOP_MESSAGE
+        pickled_message = self._PICKLED_MESSAGE
+        loads = pickle.loads
+
+        try:
+            for log_writer in self._log_writers:
+                log_writer.start()
 
-        while True:
-            try:
-                message = self._log_queue.get()
-                if message == self._STOP_MESSAGE:
-                    break
+            stop = False
+            while not stop:
+                try:
+                    # Take all queued messages and write them at once
+                    messages = []
+                    for tag, message in get_many():
+                        if tag == stop_message:
+                            stop = True
+                            break
+                        if tag == pickled_message:
+                            message = loads(message)
+                        messages.append(message)
 
-                for log_writer in self._log_writers:
-                    log_writer.write(message)
+                    if messages:
+                        write_many(messages)
 
-            except KeyboardInterrupt:
-                continue
+                except KeyboardInterrupt:
+                    continue
+        finally:
+            # Let producers stop waiting for free space even if log writer raised and loop is broken
+            self._log_queue.set_reading(False)
 
         for log_writer in self._log_writers:
             log_writer.stop()
@@ -134,6 +223,7 @@ class Nyanger:
         Creating and starts logging process.
         :return:
         """
+        self._log_queue.set_reading(True)
         self._nyan_process = Process(target=self._logging_loop, name=f"{self.name}_logger", daemon=True)
         self._nyan_process.start()
 
@@ -145,21 +235,28 @@ class Nyanger:
         :param timeout: Number of seconds to wait for process to terminate.
         :return:
         """
-        self._log_queue.put(self._STOP_MESSAGE)
+        self._log_queue.put(b"", self._STOP_MESSAGE, timeout)
         self._nyan_process.join(timeout=timeout)
         self._nyan_process.terminate()
+        self._log_queue.set_reading(False)
 
     def log(self, message: str, severity: LogLevel):
         """
         Puts message to logging queue. This method captures time of the message.
+        If logging process is not running and queue is full, message is dropped.
+        Message is also dropped if queue is full and logging process frees no space in it for a second.
         :param message: text to be logged.
         :param severity: severity of the message.
         :return:
         """
-        # Filter messages with severity lower than self.loging_level
-        if severity.value <= self.loging_level.value:
-            # Create and put LogMessage to log queue
-            self._log_queue.put(LogMessage(datetime.now(), severity, message))
+        # Filter messages with severity lower than self.loging_level or than levels of all log writers
+        if severity <= self._effective_level:
+            # Create LogMessage, format it by log writers and put result to log queue
+            data = self._format(LogMessage(time_ns(), severity, message))
+            if type(data) is bytes:
+                self._log_queue.put(data, self._BYTES_MESSAGE)
+            elif data is not None:
+                self._log_queue.put(pickle.dumps(data, pickle.HIGHEST_PROTOCOL), self._PICKLED_MESSAGE)
 
     def other(self, message: str):
         """
@@ -16,7 +16,12 @@
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from typing import Optional
+import codecs
+import io
+import os
 import sys
+import time
+import weakref
 from nyanger.simple.nyan import LogLevel, LogMessage, LogWriter
 
 
@@ -60,11 +65,64 @@ class Colors:
         LIGHT_GRAY = '\033[47m'
 
 
+_ERROR = LogLevel.ERROR.value
+"""Severity value of messages that are flushed immediately."""
+
+
+class _TextStreamRaw(io.RawIOBase):
+    """
+    Raw binary stream writing decoded bytes to text stream.
+    Used when sys.stdout has no file descriptor, like io.StringIO or IDE console, or is None under pythonw.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize _TextStreamRaw instance.
+        :param stream: text stream to write to, or None to discard written bytes.
+        """
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder("utf-8")("backslashreplace")
+        """Keeps incomplete UTF-8 sequence split between writes."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._stream is not None:
+            self._stream.write(self._decoder.decode(data))
+            self._stream.flush()
+        return len(data)
+
+
+def _flush_before_fork(writer_ref: weakref.ref):
+    """Flush writer buffer before fork, so buffered messages are not copied to child and written twice."""
+    writer = writer_ref()
+    if writer is not None and writer._buf is not None:
+        writer._buf.flush()
+
+
+def _reopen_in_child(writer_ref: weakref.ref):
+    """Drop writer buffer copied to forked child, child opens its own on next write."""
+    writer = writer_ref()
+    if writer is not None and writer._buf is not None:
+        writer._buf = None
+        # Child processes of multiprocessing exit with os._exit, flush their messages in its exit finalizers.
+        # Finalizers are cleared in child after fork hooks run, so finalizer is added by multiprocessing after forker.
+        mp_util = sys.modules.get("multiprocessing.util")
+        if mp_util is not None:
+            mp_util.register_after_fork(writer, lambda w: mp_util.Finalize(w, w.stop, exitpriority=0))
+
+
 class ConsoleWriter(LogWriter):
     """
     Simple implementation of LogWriter.
     Writes colored formatted messages to console.
+    Messages are written straight to stdout file descriptor taken on start, so reassigning sys.stdout
+    afterwards does not redirect them. If sys.stdout has no file descriptor, messages are written to it as text.
     """
+    BUFFER_SIZE = 65536
+    """Size of the output buffer in bytes."""
+
     def __init__(self, loging_level: LogLevel = LogLevel.DEBUG, color_map: Optional[dict[LogLevel, str]] = None):
         """
         Initialize ConsoleWriter instance.
@@ -72,6 +130,7 @@ class ConsoleWriter(LogWriter):
         :param color_map: dictionary mapping console color codes to logging levels.
         """
         self._loging_level = loging_level
+        self._level_int = loging_level.value
 
         if color_map is None:
             self._color_map = {
@@ -83,19 +142,72 @@ class ConsoleWriter(LogWriter):
         else:
             self._color_map = color_map
 
+        self._color_tuple = tuple(self._color_map.get(severity, "").encode() for severity in LogLevel)
+        """Color codes encoded to bytes, indexed by severity value."""
+        self._severity_tuple = tuple(f"%06d {severity.name}: ".encode() for severity in LogLevel)
+        """Microseconds format followed by severity name, indexed by severity value."""
+        self._suffix = b"\n" + Colors.RESET.encode()
+        self._last_seconds_prefixes = (None, ())
+        """Second of the last written message and line prefixes (color and time) of each severity for that second."""
+
+        self._buf: Optional[io.BufferedWriter] = None
+        """Buffer accumulating formatted messages, flushed when full, on ERROR messages and on stop."""
+        self._fork_hooks_registered = False
+
+    def _open(self):
+        # Write directly to stdout file descriptor through our own buffer,
+        # closefd=False so garbage collection of the buffer never closes stdout.
+        try:
+            raw = io.FileIO(sys.stdout.fileno(), "wb", closefd=False)
+        except (AttributeError, OSError, ValueError):
+            # io.UnsupportedOperation is an OSError and ValueError, AttributeError is raised if sys.stdout is None
+            raw = _TextStreamRaw(sys.stdout)
+        self._buf = io.BufferedWriter(raw, buffer_size=self.BUFFER_SIZE)
+
+        # Fork hooks can not be unregistered, they hold weak reference so writer still can be garbage collected
+        if not self._fork_hooks_registered and hasattr(os, "register_at_fork"):
+            writer_ref = weakref.ref(self)
+            os.register_at_fork(before=lambda: _flush_before_fork(writer_ref),
+                                after_in_child=lambda: _reopen_in_child(writer_ref))
+            self._fork_hooks_registered = True
+
     def start(self):
-        """Doing nothing"""
-        pass
+        """
+        Take stdout to write messages to.
+        Flush sys.stdout so text printed before logger start precedes log messages.
+        """
+        if sys.stdout is not None:
+            sys.stdout.flush()
+        if self._buf is None:
+            self._open()
+
+    def get_loging_level(self) -> LogLevel:
+        """Logging level of the writer."""
+        return self._loging_level
 
     def write(self, msg: LogMessage):
         """
         Formats and writes msg to (sys.stdout).
+        Messages are buffered, buffer is flushed when full or when ERROR message is written.
         :param msg: message to be logged.
         """
-        if msg.severity.value <= self._loging_level.value:
-            log_text = f"{self._color_map[msg.severity]}{msg.time.isoformat()} {msg.severity.name}: {msg.text}\n{Colors.RESET}"
-            sys.stdout.write(log_text)
+        severity = msg.severity
+        if severity <= self._level_int:
+            seconds, nanoseconds = divmod(msg.time, 1_000_000_000)
+            last_seconds, prefixes = self._last_seconds_prefixes
+            if seconds != last_seconds:
+                seconds_iso = time.strftime("%Y-%m-%dT%H:%M:%S.", time.localtime(seconds)).encode()
+                prefixes = tuple(color + seconds_iso for color in self._color_tuple)
+                self._last_seconds_prefixes = (seconds, prefixes)
+            if self._buf is None:
+                # Message is logged before start
+                self._open()
+            self._buf.write(b"".join((prefixes[severity], self._severity_tuple[severity] % (nanoseconds // 1000),
+                                      msg.text_bytes, self._suffix)))
+            if severity == _ERROR:
+                self._buf.flush()
 
     def stop(self):
-        """Doing nothing"""
-        pass
+        """Flush buffered messages."""
+        if self._buf is not None:
+            self._buf.flush()
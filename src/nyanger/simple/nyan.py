@@ -15,14 +15,16 @@
 #     You should have received a copy of the GNU General Public License
 #     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from typing import Optional
 from abc import ABC, abstractmethod
-from datetime import datetime
-from enum import Enum
+from time import time_ns
+from enum import IntEnum
 
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """
     Enumerates logging levels.
+    Levels are ints, so they can be compared and used as indexes without accessing enum value.
     """
     OTHER = 0
     INFO = 1
@@ -34,18 +36,21 @@ class LogLevel(Enum):
 class LogMessage:
     """
     Represents message to be logged.
-    Contains time severity and text fields.
+    Contains time severity and text fields, and text encoded to UTF-8 once for all log writers.
     """
-    def __init__(self, time: datetime, severity: LogLevel, text: str):
+    __slots__ = ("time", "severity", "text", "text_bytes")
+
+    def __init__(self, time: int, severity: LogLevel, text: str):
         """
         Initialize LogMessage instance.
-        :param time: message time.
+        :param time: message time in nanoseconds since the epoch, as returned by time.time_ns().
         :param severity: severity level of the message.
         :param text: message content.
         """
         self.time = time
         self.severity = severity
         self.text = text
+        self.text_bytes = text.encode("utf-8", "backslashreplace")
 
 
 class LogWriter(ABC):
@@ -71,6 +76,14 @@ class LogWriter(ABC):
         :return:
         """
 
+    def get_loging_level(self) -> Optional[LogLevel]:
+        """
+        Messages with severity less than returned level will not be written by this writer.
+        Nyanger uses it to filter out messages that no writer will write.
+        :return: logging level of the writer, or None if writer writes messages of any severity.
+        """
+        return None
+
     @abstractmethod
     def stop(self):
         """
@@ -93,13 +106,34 @@ class Nyanger:
         """
         self.name = name
         """Logger name."""
+        self._log_writers = tuple(log_writers)
+        """Log writers, frozen to a tuple as they never change after initialization."""
         self.loging_level = loging_level
-        """Logging level, messages with severity less than this field value will be filtered out."""
-        self._log_writers = log_writers.copy()
-        """List of log writers."""
+        self._write = self._log_writers[0].write if len(self._log_writers) == 1 else self._write_all
+        """Writes message to log writers, bound directly to the write method when there is only one writer."""
         self._active = False
         self._stopped = False
 
+    @property
+    def loging_level(self) -> LogLevel:
+        """Logging level, messages with severity less than this field value will be filtered out."""
+        return self._loging_level
+
+    @loging_level.setter
+    def loging_level(self, loging_level: LogLevel):
+        self._loging_level = loging_level
+        # Messages that no log writer will write are filtered out right away,
+        # plain int is cheaper to compare than enum value on every log call
+        effective_level = loging_level.value
+        writer_levels = [log_writer.get_loging_level() for log_writer in self._log_writers]
+        if writer_levels and None not in writer_levels:
+            effective_level = min(effective_level, max(level.value for level in writer_levels))
+        self._effective_level = effective_level
+
+    def _write_all(self, message: LogMessage):
+        for log_writer in self._log_writers:
+            log_writer.write(message)
+
     def is_active(self) -> bool:
         return self._active
 
@@ -130,12 +164,10 @@ class Nyanger:
         :param message: text to be logged.
         :param severity: severity of the message.
         """
-        # Filter messages with severity lower than self.loging_level
-        if severity.value <= self.loging_level.value:
+        # Filter messages with severity lower than self.loging_level or than levels of all log writers
+        if severity <= self._effective_level:
             # Create and write LogMessage to log writers
-            message = LogMessage(datetime.now(), severity, message)
-            for log_writer in self._log_writers:
-                log_writer.write(message)
+            self._write(LogMessage(time_ns(), severity, message))
 
     def other(self, message: str):
         """
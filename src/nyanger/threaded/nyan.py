@@ -0,0 +1,206 @@
+#     Nyanger is a simple logger designed to be simple to use and simple to modify.
+#
+#     Copyright (C) 2024  Kirill Harmatulla Shakirov  kirill.shakirov@protonmail.com
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+from threading import Event, Thread
+from typing import Optional
+from time import time_ns
+from nyanger.process.nyan import LogLevel, LogMessage, LogWriter
+
+
+class Nyanger:
+    """
+    Simple logger designed to be simple in use and simple in changing by its user.
+    Writes messages in background thread, uses the same log writers as process Nyanger.
+    Log writer format method is called in that thread too, and its result is not pickled.
+    """
+
+    def __init__(self, name: str, loging_level: LogLevel, log_writers: list[LogWriter]):
+        self.name = name
+        """Logger name."""
+        self._log_writers = tuple(log_writers)
+        """Log writers, frozen to a tuple as they never change after initialization."""
+        self.loging_level = loging_level
+        if len(self._log_writers) == 1:
+            self._format = self._log_writers[0].format
+            self._write_many = self._log_writers[0].write_many
+        else:
+            self._format = self._format_all
+            self._write_many = self._write_many_all
+        """Format and write messages, bound directly to log writer methods when there is only one writer."""
+        self._log_queue: deque[LogMessage | int] = deque()
+        """Queue of log messages used to pass them to logging thread, deque append and popleft are thread-safe."""
+        self._log_event = Event()
+        """Set when messages are added to self._log_queue, wakes up logging thread."""
+        self._nyan_thread: Optional[Thread] = None
+        """Stores logging thread."""
+        self._stopped = False
+        """Set when logging thread ends or is being stopped, messages are dropped after that."""
+        self._STOP_MESSAGE = 0
+        """Constant representing message that need to be putted in self._log_queue in order to break logging loop."""
+
+    @property
+    def loging_level(self) -> LogLevel:
+        """Logging level, messages with severity less than this field value will be filtered out."""
+        return self._loging_level
+
+    @loging_level.setter
+    def loging_level(self, loging_level: LogLevel):
+        self._loging_level = loging_level
+        # Messages that no log writer will write are filtered out right away,
+        # plain int is cheaper to compare than enum value on every log call
+        effective_level = loging_level.value
+        writer_levels = [log_writer.get_loging_level() for log_writer in self._log_writers]
+        if writer_levels and None not in writer_levels:
+            effective_level = min(effective_level, max(level.value for level in writer_levels))
+        self._effective_level = effective_level
+
+    def _format_all(self, message: LogMessage) -> tuple:
+        return tuple(log_writer.format(message) for log_writer in self._log_writers)
+
+    def _write_many_all(self, messages: list[tuple]):
+        for i, log_writer in enumerate(self._log_writers):
+            log_writer_messages = [message[i] for message in messages if message[i] is not None]
+            if log_writer_messages:
+                log_writer.write_many(log_writer_messages)
+
+    def _logging_loop(self):
+        # Bound once to locals, they are cheaper to look up than attributes on every message
+        log_queue = self._log_queue
+        popleft = log_queue.popleft
+        wait = self._log_event.wait
+        clear = self._log_event.clear
+        format_message = self._format
+        write_many = self._write_many
+        stop_message = self._STOP_MESSAGE
+
+        try:
+            for log_writer in self._log_writers:
+                log_writer.start()
+
+            stop = False
+            while not stop:
+                wait()
+                # Clear before taking messages, so messages added after that set event again
+                clear()
+
+                # Take all queued messages, format them in this thread and write them at once
+                messages = []
+                while log_queue:
+                    message = popleft()
+                    if message == stop_message:
+                        stop = True
+                        break
+                    data = format_message(message)
+                    if data is not None:
+                        messages.append(data)
+
+                if messages:
+                    write_many(messages)
+        finally:
+            # No one takes messages from the queue anymore, even if log writer raised and thread is dying
+            self._stopped = True
+            log_queue.clear()
+
+        for log_writer in self._log_writers:
+            log_writer.stop()
+
+    def is_running(self):
+        """
+        Checks out logging thread running status.
+        :return: True if logging thread is alive and False otherwise.
+        """
+        if self._nyan_thread is None:
+            return False
+        return self._nyan_thread.is_alive()
+
+    def start(self):
+        """
+        Starts Nyanger.
+        Creating and starts logging thread.
+        :return:
+        """
+        self._nyan_thread = Thread(target=self._logging_loop, name=f"{self.name}_logger", daemon=True)
+        self._nyan_thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stops Nyanger.
+        Sending stop message to logging thread and waits timeout seconds for thread end.
+        :param timeout: Number of seconds to wait for thread to end.
+        :return:
+        """
+        self._stopped = True
+        self._log_queue.append(self._STOP_MESSAGE)
+        self._log_event.set()
+        self._nyan_thread.join(timeout=timeout)
+
+    def log(self, message: str, severity: LogLevel):
+        """
+        Puts message to logging queue. This method captures time of the message.
+        Message is dropped if logger is stopped or its logging thread has ended.
+        :param message: text to be logged.
+        :param severity: severity of the message.
+        :return:
+        """
+        # Filter messages with severity lower than self.loging_level or than levels of all log writers
+        if severity <= self._effective_level and not self._stopped:
+            # Create and put LogMessage to log queue
+            self._log_queue.append(LogMessage(time_ns(), severity, message))
+            # Setting event takes a lock, skip it if logging thread is already woken up
+            if not self._log_event.is_set():
+                self._log_event.set()
+
+    def other(self, message: str):
+        """
+        Log message with OTHER severity level.
+        :param message: text to be logged.
+        :return:
+        """
+        self.log(message, LogLevel.OTHER)
+
+    def info(self, message: str):
+        """
+        Log message with INFO severity level.
+        :param message: text to be logged.
+        :return:
+        """
+        self.log(message, LogLevel.INFO)
+
+    def warning(self, message: str):
+        """
+        Log message with WARNING severity level.
+        :param message: text to be logged.
+        :return:
+        """
+        self.log(message, LogLevel.WARNING)
+
+    def error(self, message: str):
+        """
+        Log message with ERROR severity level.
+        :param message: text to be logged.
+        :return:
+        """
+        self.log(message, LogLevel.ERROR)
+
+    def debug(self, message: str):
+        """
+        Log message with DEBUG severity level.
+        :param message: text to be logged.
+        :return:
+        """
+        self.log(message, LogLevel.DEBUG)